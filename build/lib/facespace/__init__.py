@@ -1,2 +0,0 @@
-# facespace/__init__.py
-from .facespace_client import LogsAPI, FaceSpaceError
\ No newline at end of file
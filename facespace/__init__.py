@@ -1,2 +1,22 @@
-# facespace/__init__.py
-from .facespace_client import LogsAPI, FaceSpaceError
\ No newline at end of file
+# Public names are resolved on first access (PEP 562), so 'import facespace' does not import requests or dateutil
+from ._version import __version__
+
+__all__ = ["LogsAPI", "FaceSpaceError", "session"]
+
+
+def __getattr__(name):
+    if name == "session":
+        from .http import shared_session
+        value = shared_session()  # The pooled session shared by the whole process
+        globals()[name] = value
+        return value
+    if name in __all__:
+        from . import facespace_client
+        value = getattr(facespace_client, name)
+        globals()[name] = value  # Cache so later lookups skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
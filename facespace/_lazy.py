@@ -0,0 +1,58 @@
+###############################################################################################
+#                                                                                             #
+#                               AUTOMA CORPORATION (c) 2023                                   #
+#                                                                                             #
+#      ALL RIGHTS RESERVED. UNAUTHORIZED COPYING, REPRODUCTION, HIRE, LENDING, PUBLIC         #
+#      PERFORMANCE, AND BROADCASTING OF THIS SOFTWARE, VIA ANY MEDIUM, ARE PROHIBITED.        #
+#                                                                                             #
+#                  PROPRIETARY AND CONFIDENTIAL INFORMATION OF AUTOMA CORPORATION             #
+#                                                                                             #
+###############################################################################################
+
+
+import importlib
+
+
+class _LazyModule:
+    """Stand-in for a module that is only imported the first time one of its attributes is used"""
+    def __init__(self, name, extra=None):
+        self._name = name  # Dotted name of the module to import
+        self._extra = extra  # Package extra that installs the module, used in the error message
+        self._module = None  # The real module once imported
+
+    def __getattr__(self, attr):
+        # Only called for attributes not found on the proxy itself, i.e. those of the wrapped module
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError as err:
+                if self._extra is None:
+                    raise
+                raise ImportError(
+                    f"'{self._name}' is required for this feature, install it with: pip install facespace[{self._extra}]"
+                ) from err
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name, extra=None):
+    """
+    Summary:
+        Returns a proxy for a module that defers importing it until first use.
+
+    Description:
+        The module is imported with 'importlib.import_module' the first time an attribute is accessed on the proxy,
+        so code paths that never use it skip the import cost entirely. If the module belongs to an optional extra,
+        a missing install raises an ImportError naming the extra to install.
+
+    Parameters:
+        - 'name': The dotted name of the module, e.g. 'dateutil.parser'.
+        - 'extra': Optional; The name of the package extra that provides the module, e.g. 'dates'.
+
+    Returns:
+        - A proxy object that forwards attribute access to the imported module.
+    """
+    return _LazyModule(name, extra)
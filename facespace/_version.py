@@ -0,0 +1,2 @@
+# Single source of the package version, read by setuptools at build time and re-exported by the package
+__version__ = "0.2.0"
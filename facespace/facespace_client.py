@@ -10,14 +10,26 @@
 ###############################################################################################
 
 
-import os, requests, time, traceback, logging, inspect, signal
-from datetime import datetime
-from dateutil import parser
+import os, requests, time, atexit, logging, signal, sys, linecache, functools, queue, threading, collections, operator, math
+from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
+from ._lazy import lazy_import
+
+try:
+    import orjson as _json  # Faster JSON decoding when the optional wheel is installed
+except ImportError:
+    import json as _json
+
+
+parser = lazy_import("dateutil.parser", extra="dates")  # Optional and deferred, only needed to parse dates
 
 
 API_BASE_URL = "https://visionapi.automa.one/facespace"
+STREAM_CONTENT_TYPE = "application/x-ndjson"  # Content type advertised by the API when it streams logs
+STREAM_TIMEOUT = (5, 90)  # Connect and read timeouts of the log stream, the read timeout must outlast the server's keep-alive interval
+STREAM_POLL_INTERVAL = 0.5  # Seconds between checks of the 'running' flag while waiting for the next streamed log
 
 
 logging.basicConfig(
@@ -29,6 +41,69 @@ logger = logging.getLogger('FaceSpaceLogger')
 logger.propagate = False
 
 
+# Log level names accepted by the level setters, including the FaceSpace specific aliases
+_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+    'heartbeat': logging.DEBUG,  # Alias used for the per-request heartbeat messages
+    'log': logging.INFO,  # Alias used for general logs
+}
+_HEARTBEAT_LEVEL = _LEVELS['heartbeat']
+
+
+# Retry strategy shared by every client session; Retry objects are immutable and safe to share
+_RETRY = Retry(
+    total=5,  # Maximum number of retry attempts
+    status_forcelist=frozenset([429, 500, 502, 503, 504]),  # HTTP status codes to trigger a retry
+    allowed_methods=frozenset(["HEAD", "GET", "OPTIONS", "POST"]),  # HTTP methods to be retried
+    backoff_factor=1  # Factor by which the delay until next retry will increase
+)
+
+
+def _new_adapter():
+    """Creates a pooled HTTPAdapter using the shared retry strategy, adapters own a pool and are not shared across sessions"""
+    return HTTPAdapter(max_retries=_RETRY)
+
+
+# Sentinel put on the webhook queue to tell the background worker to exit
+_WEBHOOK_STOP = object()
+
+# Sentinel put on the stream queue when the server closes the log stream
+_STREAM_END = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _is_for_loop_line(filename, lineno):
+    """Checks whether the source line at a call site contains 'for' loop syntax, cached per call site"""
+    line = linecache.getline(filename, lineno)
+    return 'for ' in line and ' in ' in line
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date_cached(date_str, today):
+    """
+    Parses a date string for 'LogsAPI._parse_date', cached so repeated queries skip dateutil.
+    Fields missing from the string (e.g. the date in '10:30' or the year in '01/02') are filled from 'today',
+    which is part of the cache key so relative inputs are re-evaluated once the day changes.
+    """
+    default = datetime(today.year, today.month, today.day)  # Source of any fields missing from date_str
+    try:
+        # Check if the date_str includes time
+        if ' ' in date_str.strip():
+            # If time is included, parse the full datetime
+            return parser.parse(date_str, default=default).strftime('%H:%M %d/%m/%y')
+        else:
+            # If only the date is provided, parse without the time
+            return parser.parse(date_str, default=default).strftime('%d/%m/%y')
+    except (ValueError, OverflowError) as err:
+        error_message = f"Invalid date format: {date_str}"
+        logger.exception(error_message)  # Log the error, traceback is rendered lazily
+        raise DateParseError(error_message) from err  # Raise a DateParseError, keeping the cause
+
+
 # Custom Exception classes
 class FaceSpaceError(Exception):
     """Base class for other exceptions"""
@@ -75,7 +150,7 @@ class ForLoopError(FaceSpaceError):
 
 class LogsAPI:
     """The main class to use for communicating with FaceSpace APIs"""
-    def __init__(self, api_key=None, log_to_file=False, log_level=logging.INFO, file_log_level=logging.DEBUG, additional_headers=None, webhook_url=None, post_realtime=True, post_logs=False, gaze_detection=False):
+    def __init__(self, api_key=None, log_to_file=False, log_level=logging.INFO, file_log_level=logging.DEBUG, additional_headers=None, webhook_url=None, post_realtime=True, post_logs=False, gaze_detection=False, batch_max=64, batch_interval=0.25, max_buffered_logs=10_000):
         """
         Summary:
             Initializes the logging API client with configurable parameters.
@@ -92,6 +167,9 @@ class LogsAPI:
             - 'webhook_url': Optional; The URL to which logs will be posted.
             - 'post_realtime': Optional; Boolean indicating whether logs should be posted in real-time.
             - 'post_logs': Optional; Boolean indicating whether logs should be posted at all.
+            - 'batch_max': Optional; The maximum number of logs sent to the webhook in a single POST.
+            - 'batch_interval': Optional; The time (in seconds) to wait for more logs before posting a batch.
+            - 'max_buffered_logs': Optional; The maximum number of realtime logs kept in 'logs', oldest dropped first. None keeps all logs.
 
         Exceptions:
             - Raises APIKeyError if an API key is not provided or found in environment variables.
@@ -102,10 +180,11 @@ class LogsAPI:
         if not self.api_key:
             raise APIKeyError("API key must be set before using the client.")
         self.headers = {"x-api-key": self.api_key}  # Set the API key in the headers
-        self.logs = []  # Initialize the list to store logs
+        self.logs = collections.deque(maxlen=max_buffered_logs)  # Initialize the bounded buffer to store logs
         self.post_realtime = post_realtime  # Set the flag for real-time log posting
         self.post_logs = post_logs  # Set the flag for log posting
         self.running = False  # Initialize the running state of the logger
+        self._stop_event = threading.Event()  # Stop token of the current realtime run, replaced by 'start_fetching'
         self._within_context_manager = False  # Internal flag for context manager state
         signal.signal(signal.SIGINT, self.signal_handler)  # Set up signal handling for graceful shutdown
         self.request_count = 0  # Initialize the request count
@@ -120,9 +199,30 @@ class LogsAPI:
         # Update the headers with additional headers
         self.headers.update(self.additional_headers)
         
-        # Add retries to the session for robustness
-        retries = Retry(total=5, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
+        # Apply the headers at session level so they are not merged into every request
+        self.session.headers.update(self.headers)
+        
+        # Full endpoint URLs, built once instead of on every request
+        self._url_logs = API_BASE_URL + "/logs"
+        self._url_recognition = API_BASE_URL + "/recognition"
+        
+        # Add retries to the session for robustness, mounted once so pooled connections are kept warm
+        # requests' default pool of 10 connections per host already covers 'get_logs_range' alongside the prefetch worker
+        self.session.mount('https://', _new_adapter())
+        
+        # Persistent session for webhook posts so keep-alive connections are reused between logs
+        self.webhook_session = requests.Session()
+        self.webhook_session.headers.update(self.headers)
+        self.webhook_session.mount('https://', _new_adapter())
+        
+        # Bounded queue drained by a background worker, so webhook posts never block log fetching
+        self._webhook_q = queue.Queue(maxsize=1024)
+        self._webhook_thread = None
+        self.batch_max = batch_max  # Maximum number of payloads coalesced into one webhook POST
+        self.batch_interval = batch_interval  # Time window for coalescing payloads into a batch
+        
+        # Single worker used to prefetch the next realtime log while the current one is being processed
+        self._exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='FaceSpacePrefetch')
         
         # Set up a stream handler for console logs and add it to the logger
         console_handler = logging.StreamHandler()
@@ -141,12 +241,6 @@ class LogsAPI:
             logger.addHandler(file_handler)
             file_handler.setLevel(file_log_level) 
             
-        self.log_levels = {
-            'heartbeat': logging.DEBUG,  # Lowest level for heartbeat messages
-            'error': logging.ERROR,  # Highest level for error messages
-            'log': logging.INFO,  # Middle level for general logs
-        }
-        
         self.set_display_log_level(log_level)  # Set the initial log level for display
 
                 
@@ -172,27 +266,13 @@ class LogsAPI:
             This method configures the logging level for console output. It accepts both string and integer inputs to define the log level. If a string is provided, it is converted to the corresponding logging level.
 
         Parameters:
-            - 'level': Can be a string representing the log level ('debug', 'info', 'warning', 'error', 'critical') or an integer as defined in the logging module.
+            - 'level': Can be a string representing the log level ('debug', 'info', 'warning', 'error', 'critical', or the aliases 'heartbeat' and 'log') or an integer as defined in the logging module.
 
         Exceptions:
             - Raises ValueError if the string log level name is invalid.
             - Raises TypeError if the log level is neither an int nor a str.
         """
-        # Check if the log level is specified as a string
-        if isinstance(level, str):
-            level_name = level.lower()  # Convert the level name to lowercase to ensure case-insensitivity
-            # Set the console handler log level if the level name is valid
-            if level_name in self.log_levels:
-                self.console_handler.setLevel(self.log_levels[level_name])
-            else:
-                # Raise an error if the level name is not recognized
-                raise ValueError(f"Invalid log level name: {level}")
-        # Check if the log level is specified as an integer
-        elif isinstance(level, int):
-            self.console_handler.setLevel(level)  # Set the console handler log level directly
-        else:
-            # Raise an error if the log level is neither an int nor a str
-            raise TypeError("Log level must be either an int or str.")
+        self._set_level(self.console_handler, level)
 
 
     def set_file_log_level(self, level):
@@ -204,44 +284,38 @@ class LogsAPI:
             This method configures the logging level for file output, provided that file logging is enabled. It accepts both string and integer inputs to define the log level. If a string is provided, it is checked against predefined log levels.
 
         Parameters:
-            - 'level': Can be a string representing the log level ('debug', 'info', 'warning', 'error', 'critical') or an integer as defined in the logging module.
+            - 'level': Can be a string representing the log level ('debug', 'info', 'warning', 'error', 'critical', or the aliases 'heartbeat' and 'log') or an integer as defined in the logging module.
 
         Exceptions:
             - Raises ValueError if file logging is not enabled or if the string log level name is invalid.
             - Raises TypeError if the log level is neither an int nor a str.
         """
-        # Check if the file handler attribute exists to ensure file logging is enabled
-        if hasattr(self, 'file_handler'):
-            # Check if the log level is specified as a string
-            if isinstance(level, str):
-                level_name = level.lower()  # Normalize the level name to lowercase
-                # Set the file handler log level if the level name is valid
-                if level_name in self.log_levels:
-                    self.file_handler.setLevel(self.log_levels[level_name])
-                else:
-                    # Raise an error if the level name is not recognized
-                    raise ValueError(f"Invalid log level name: {level}")
-            # Check if the log level is specified as an integer
-            elif isinstance(level, int):
-                self.file_handler.setLevel(level)  # Set the file handler log level directly
-            else:
-                # Raise an error if the log level is neither an int nor a str
-                raise TypeError("Log level must be either an int or str.")
-        else:
-            # Raise an error if file logging is not enabled
+        # Check that a file handler exists to ensure file logging is enabled
+        if self.file_handler is None:
             raise ValueError("File logging is not enabled.")
+        self._set_level(self.file_handler, level)
+
+
+    def _set_level(self, handler, level):
+        """Sets the level of a handler from a level name or an integer, shared by the public level setters"""
+        try:
+            # Level names are case-insensitive; integers are passed through and validated by the logging module
+            handler.setLevel(_LEVELS[level.lower()] if isinstance(level, str) else level)
+        except KeyError:
+            # Raise an error if the level name is not recognized
+            raise ValueError(f"Invalid log level name: {level}") from None
 
 
     def _increment_request_count(self):
         """To track the number of requests made to the API for future logging"""
         self.request_count += 1
-        logger.log(self.log_levels['heartbeat'], f"Total requests made: {self.request_count}") 
+        if logger.isEnabledFor(_HEARTBEAT_LEVEL):  # Skip building the record when heartbeats are filtered out
+            logger.log(_HEARTBEAT_LEVEL, "Total requests made: %d", self.request_count)
     
     
     def signal_handler(self, sig, frame):
-        """To handle terminal quitting"""
-        logger.info('SIGINT or CTRL-C detected. Stopping log fetching.')
-        self.stop_realtime_logs()
+        """To handle terminal quitting, only flips the running flag so the realtime loop cleans up outside the signal context"""
+        self.running = False
 
 
     def _perform_request_with_retry(self, method, url, **kwargs):
@@ -250,9 +324,9 @@ class LogsAPI:
             Executes an HTTP request with automatic retries for certain status codes.
 
         Description:
-            This private method attempts to perform an HTTP request using a session with a mounted retry strategy.
+            This private method attempts to perform an HTTP request using the session and the retry strategy mounted in '__init__'.
             It retries on specific HTTP status codes with exponential backoff. If a webhook URL is provided and
-            post_logs is enabled, it will also send the response to the webhook URL.
+            post_logs is enabled, it will also queue the response for delivery to the webhook URL.
 
         Parameters:
             - 'method': The HTTP method to be used for the request (e.g., 'GET', 'POST').
@@ -261,71 +335,133 @@ class LogsAPI:
 
         Exceptions:
             - Raises HTTPRequestError if the request exceeds the maximum number of retries.
-            - Logs an error message if the webhook POST fails.
-        """
-        # Define a retry strategy for the session
-        retry_strategy = Retry(
-            total=3,  # Maximum number of retry attempts
-            status_forcelist=[429, 500, 502, 503, 504],  # HTTP status codes to trigger a retry
-            allowed_methods=["HEAD", "GET", "OPTIONS"],  # HTTP methods to be retried
-            backoff_factor=1  # Factor by which the delay until next retry will increase
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)  # Create an adapter with the retry strategy
-        self.session.mount('https://', adapter)  # Mount the adapter for HTTPS requests
-        
+        """
         try:
             response = self.session.request(method, url, **kwargs)  # Perform the HTTP request
             response.raise_for_status()  # Raise an exception for HTTP error codes
+            raw = response.content  # Keep the raw body so the webhook can forward it without re-encoding
+            data = _json.loads(raw)  # Decode the JSON response once
 
-            # If a webhook URL is provided and post_logs is True, post the response to the webhook
+            # If a webhook URL is provided and post_logs is True, queue the raw response for the webhook
             if self.webhook_url and self.post_logs == True:
-                try:
-                    webhook_response = requests.post(self.webhook_url, json=response.json(), headers=self.headers)
-                    webhook_response.raise_for_status()  # Raise an exception for HTTP error codes
-                    logger.debug(f"Webhook POST successful: {webhook_response.json()}")  # Log success
-                except requests.exceptions.RequestException as e:
-                    logger.error(f"Webhook POST failed: {e}")  # Log any exception that occurs
+                self._post_webhook(raw)
 
-            return response.json()  # Return the JSON response
+            return data  # Return the JSON response
         except requests.exceptions.RetryError as retry_err:
             logger.error(f"Retry Error: {retry_err}")  # Log the retry error
             raise HTTPRequestError(f"Retry Error: {retry_err}")  # Raise an exception if retries fail
 
 
-    def _request(self, method, endpoint, **kwargs):
+    def _request(self, method, url, **kwargs):
         """
         Summary:
-            Sends an HTTP request to a specified endpoint with error handling.
+            Sends an HTTP request to a specified endpoint URL with error handling.
 
         Description:
-            This private method sends an HTTP request using the specified method and endpoint.
+            This private method sends an HTTP request using the specified method and endpoint URL.
             It automatically increments the request count and handles both HTTP-specific and general
             exceptions, logging detailed error messages and traceback information.
 
         Parameters:
             - 'method': The HTTP method to be used for the request (e.g., 'GET', 'POST').
-            - 'endpoint': The endpoint (path relative to the base URL) to which the request is to be sent.
+            - 'url': The full endpoint URL (one of the URLs precomputed in '__init__') to which the request is to be sent.
             - '**kwargs': Additional keyword arguments that are passed to the '_perform_request_with_retry' method.
 
         Exceptions:
             - Raises HTTPRequestError with a detailed error message if an HTTP error occurs.
-            - Raises HTTPRequestError with a detailed error message and traceback if any other exception occurs.
+            - Raises HTTPRequestError with a detailed error message if any other exception occurs, chained to the original exception.
         """
         self._increment_request_count()  # Increment the count of requests made
         try:
-            url = f"{API_BASE_URL}{endpoint}"  # Construct the full URL
             # Perform the request with retry logic and return the response
-            return self._perform_request_with_retry(method, url, headers=self.headers, **kwargs)
+            return self._perform_request_with_retry(method, url, **kwargs)
         except requests.HTTPError as http_err:
             # Extract error message from HTTP error response or use the error string representation
             error_message = http_err.response.json().get('error', str(http_err))
-            tb = traceback.format_exc()  # Get the traceback as a string
-            logger.error(f"HTTP Error: {error_message}\n{tb}")  # Log the HTTP error with traceback
-            raise HTTPRequestError(f"HTTP Error: {error_message}")  # Raise an HTTPRequestError with the error message
+            logger.exception("HTTP Error: %s", error_message)  # Log the HTTP error, traceback is rendered lazily
+            raise HTTPRequestError(f"HTTP Error: {error_message}") from http_err  # Raise an HTTPRequestError, keeping the cause
         except Exception as err:
-            tb = traceback.format_exc()  # Get the traceback as a string
-            logger.error(f"Request Error: {str(err)}\n{tb}")  # Log any other exception with traceback
-            raise HTTPRequestError(f"Request Error: {str(err)}")  # Raise an HTTPRequestError with the error message
+            logger.exception("Request Error: %s", err)  # Log any other exception, traceback is rendered lazily
+            raise HTTPRequestError(f"Request Error: {str(err)}") from err  # Raise an HTTPRequestError, keeping the cause
+
+
+    def _post_webhook(self, payload):
+        """
+        Summary:
+            Queues an encoded JSON payload for delivery to the webhook URL.
+
+        Description:
+            This private method hands the payload to a background worker thread, starting the worker if it is
+            not already running. If the queue is full the payload is dropped and an error is logged, keeping
+            memory bounded when the webhook is slower than the API. Queued payloads are flushed by
+            'stop_realtime_logs', and at interpreter exit for clients that are never stopped, such as a single
+            'get_logs_range' call outside a 'with' block.
+
+        Parameters:
+            - 'payload': The JSON document, as raw bytes received from the API, to be posted to the webhook URL.
+        """
+        if self._webhook_thread is None or not self._webhook_thread.is_alive():
+            if self._webhook_thread is None:
+                atexit.register(self._stop_webhook_worker)  # Flush queued posts at exit, the daemon worker is not joined
+            self._webhook_thread = threading.Thread(target=self._webhook_worker, name='FaceSpaceWebhook', daemon=True)
+            self._webhook_thread.start()
+        try:
+            self._webhook_q.put_nowait(payload)
+        except queue.Full:
+            logger.error("Webhook queue is full, dropping payload.")
+
+
+    def _webhook_worker(self):
+        """
+        Summary:
+            Background worker that posts queued payloads to the webhook URL in batches.
+
+        Description:
+            This private method runs on a daemon thread. It waits for a payload, then keeps collecting payloads
+            for up to 'batch_interval' seconds or until 'batch_max' are gathered, and posts them as a single JSON
+            array using the persistent webhook session. The array is built by joining the raw payloads, so nothing
+            is decoded or re-encoded. When the stop sentinel is received, the pending batch is
+            flushed before the worker exits. Failed posts are logged and do not stop the worker.
+        """
+        headers = {'Content-Type': 'application/json'}  # Body is sent pre-encoded, other headers come from the session
+        stopping = False
+        while not stopping:
+            payload = self._webhook_q.get()  # Block until at least one payload is available
+            if payload is _WEBHOOK_STOP:
+                break
+            batch = [payload]
+            deadline = time.monotonic() + self.batch_interval
+            # Coalesce further payloads until the batch is full or the batch interval has elapsed
+            while len(batch) < self.batch_max:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    payload = self._webhook_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if payload is _WEBHOOK_STOP:
+                    stopping = True  # Flush the current batch, then exit
+                    break
+                batch.append(payload)
+            try:
+                webhook_response = self.webhook_session.post(self.webhook_url, data=b"[" + b",".join(batch) + b"]", headers=headers)
+                webhook_response.raise_for_status()  # Check for HTTP errors and raise an exception if any
+                if logger.isEnabledFor(logging.DEBUG):  # Only decode the webhook reply when it will be logged
+                    logger.debug("Webhook POST successful: %s", webhook_response.json())  # Log the successful POST
+            except requests.exceptions.RequestException as e:
+                logger.error("Webhook POST failed: %s", e)  # Log the exception if the POST fails
+
+
+    def _stop_webhook_worker(self, timeout=5):
+        """Signals the webhook worker to flush queued posts and waits briefly for it to exit"""
+        if self._webhook_thread is not None and self._webhook_thread.is_alive():
+            try:
+                self._webhook_q.put(_WEBHOOK_STOP, timeout=timeout)
+            except queue.Full:
+                logger.error("Webhook queue is full, could not signal the webhook worker to stop.")
+                return
+            self._webhook_thread.join(timeout)
 
 
     def _parse_date(self, date_str):
@@ -336,7 +472,9 @@ class LogsAPI:
         Description:
             This private method takes a date string which may or may not include time information.
             It returns the date and time (if present) in a standardized format. If the date string
-            is in an invalid format, it logs the error and raises a DateParseError.
+            is in an invalid format, it logs the error and raises a DateParseError. Results are cached per day, so
+            repeated queries with the same date strings are not parsed again, while partial inputs such as a bare
+            time still resolve against the current date.
 
         Parameters:
             - 'date_str': A string representing the date (and optionally time).
@@ -346,26 +484,19 @@ class LogsAPI:
             or just '%d/%m/%y' if only the date is provided.
 
         Exceptions:
-            - Raises DateParseError with a detailed error message if the date string is in an invalid format.
+            - Raises DateParseError with a detailed error message if the date string is in an invalid format or is not a string.
         """
-        try:
-            # Check if the date_str includes time
-            if len(date_str.split()) > 1:
-                # If time is included, parse the full datetime
-                return parser.parse(date_str).strftime('%H:%M %d/%m/%y')
-            else:
-                # If only the date is provided, parse without the time
-                return parser.parse(date_str).strftime('%d/%m/%y')
-        except ValueError:
-            tb = traceback.format_exc()  # Get the traceback as a string
-            error_message = f"Invalid date format: {date_str}\n{tb}"
-            logger.error(error_message)  # Log the error with the traceback
-            raise DateParseError(error_message)  # Raise a DateParseError with the error message
-
-
-    def _response(self, endpoint, params=None):
+        # Reject non-string input here, unhashable values would otherwise fail inside the cache with a bare TypeError
+        if not isinstance(date_str, str):
+            error_message = f"Invalid date format: {date_str!r}"
+            logger.error(error_message)
+            raise DateParseError(error_message)
+        return _parse_date_cached(date_str, date.today())
+
+
+    def _response(self, url, params=None):
         """Make request to API while retrying if there is a server error"""
-        return self._request('GET', endpoint, params=params)
+        return self._request('GET', url, params=params)
 
 
     def get_logs_range(self, start_time=None, end_time=None, camera_id=None):
@@ -375,7 +506,7 @@ class LogsAPI:
 
         Description:
             This method fetches logs based on the provided start and end times, and optionally filters them by camera ID.
-            It validates the input formats before making the API call and uses the internal method to parse dates.
+            Dates are validated by parsing them with the internal method before making the API call.
 
         Parameters:
             - 'start_time': Optional; A string representing the start of the time range in 'dd/mm/yy' format.
@@ -386,16 +517,8 @@ class LogsAPI:
             - The response from the logs API endpoint with the logs that match the given criteria.
 
         Exceptions:
-            - Raises InvalidUsageError if 'start_time', 'end_time', or 'camera_id' are not strings.
-        """
-        # Validate the date formats and camera_id before making the request
-        if start_time and not isinstance(start_time, str):
-            raise InvalidUsageError("Start time must be a string in 'dd/mm/yy' format.")
-        if end_time and not isinstance(end_time, str):
-            raise InvalidUsageError("End time must be a string in 'dd/mm/yy' format.")
-        if camera_id and not isinstance(camera_id, str):
-            raise InvalidUsageError("Camera ID must be a string.")
-        
+            - Raises DateParseError if 'start_time' or 'end_time' is not a valid date string.
+        """
         params = {}  # Initialize the parameters dictionary
         if start_time:
             params['start_time'] = self._parse_date(start_time)  # Parse and add start time to parameters
@@ -403,7 +526,7 @@ class LogsAPI:
             params['end_time'] = self._parse_date(end_time)  # Parse and add end time to parameters
         if camera_id:
             params['camera_id'] = camera_id  # Add camera ID to parameters if provided
-        return self._response("/logs", params=params)  # Make the API call and return the response
+        return self._response(self._url_logs, params=params)  # Make the API call and return the response
 
     ##########################################################
     #     REALTIME API SECTION BELOW, DO NOT TAMPER 💀      #
@@ -417,7 +540,7 @@ class LogsAPI:
         Description:
             This method retrieves logs from the recognition API. If the logs contain a stop signal indicating no active cameras,
             it raises a custom StopLogsSignal exception. It appends successful log responses to the internal logs list and
-            posts them to a webhook URL if configured for real-time posting.
+            queues them for the webhook URL if configured for real-time posting.
 
         Returns:
             - A dictionary containing the fetched log data.
@@ -426,32 +549,90 @@ class LogsAPI:
             - Raises StopLogsSignal if a stop signal is detected in the log indicating no active cameras.
             - Raises HTTPRequestError if the response from the server is not successful (non-200 status code).
         """
-        response = self.session.get(API_BASE_URL + "/recognition", headers=self.headers)  # Perform a GET request to fetch logs
+        return self._process_log(self._raw_fetch())
+
+
+    def _raw_fetch(self):
+        """
+        Summary:
+            Requests the latest log from the recognition API endpoint.
+
+        Description:
+            This private method only performs the GET request, without touching any client state, so it can safely
+            run on the prefetch worker while the previous log is being processed.
+
+        Returns:
+            - The raw JSON body of the log.
+
+        Exceptions:
+            - Raises HTTPRequestError if the response from the server is not successful (non-200 status code).
+        """
+        response = self.session.get(self._url_recognition)  # Perform a GET request to fetch logs
         if response.status_code == 200:
-            log = response.json()  # Parse the log from the response
-            # Check for a stop signal in the log
-            if isinstance(log, dict) and 'stop' in log and log['stop'].startswith('No cameras active'):
-                raise StopLogsSignal("Stop signal received: " + log['stop'])  # Raise a StopLogsSignal exception
-            self.logs.append(log)  # Append the log to the internal list
-
-            # If a webhook URL is provided and real-time posting is enabled, post the log to the webhook
-            if self.webhook_url and self.post_realtime == True:
-                try:
-                    webhook_response = requests.post(self.webhook_url, json=log, headers=self.headers)
-                    webhook_response.raise_for_status()  # Check for HTTP errors and raise an exception if any
-                    logger.debug(f"Webhook POST successful: {webhook_response.json()}")  # Log the successful POST
-                except requests.exceptions.RequestException as e:
-                    logger.error(f"Webhook POST failed: {e}")  # Log the exception if the POST fails
+            return response.content  # Return the raw log, decoded once by '_process_log'
+        # Log and raise an error if the response status code is not 200
+        error_message = f"Error fetching logs: {response.status_code} {response.text}"
+        logger.error(error_message)
+        raise HTTPRequestError(error_message)
 
-            return log  # Return the log
-        else:
-            # Log and raise an error if the response status code is not 200
-            error_message = f"Error fetching logs: {response.status_code} {response.text}"
-            logger.error(error_message)
-            raise HTTPRequestError(error_message)
 
+    def _fetch_at(self, deadline, stop):
+        """
+        Summary:
+            Waits for a deadline, then requests the latest log.
+
+        Description:
+            This private method runs on the prefetch worker. Waiting until the deadline before requesting keeps the
+            polling cadence while ensuring the log is never fetched before it is due. The wait is on the stop token
+            of the run that scheduled the fetch, so stopping that run wakes the worker at once, and a later run that
+            starts fetching again cannot revive it.
+
+        Parameters:
+            - 'deadline': The 'time.monotonic()' value at which the log should be fetched.
+            - 'stop': The 'threading.Event' stop token of the realtime run the fetch belongs to.
+
+        Returns:
+            - The raw JSON body of the log, or None if fetching was stopped while waiting.
+        """
+        if stop.wait(max(deadline - time.monotonic(), 0)):
+            return None  # The run was stopped, skip the request
+        if not self.running:
+            return None  # A Ctrl-C only clears the 'running' flag, skip the request as well
+        return self._raw_fetch()
+
+
+    def _process_log(self, raw):
+        """
+        Summary:
+            Handles a freshly fetched log.
+
+        Description:
+            This private method decodes the log and checks it for a stop signal, appends it to the internal logs list
+            and queues the raw body for the webhook URL if configured for real-time posting.
 
-    def get_realtime_logs(self, refresh=0.5, limit=None):
+        Parameters:
+            - 'raw': The raw JSON body of the log.
+
+        Returns:
+            - The log that was processed.
+
+        Exceptions:
+            - Raises StopLogsSignal if a stop signal is detected in the log indicating no active cameras.
+        """
+        log = _json.loads(raw)  # Parse the log from the raw body
+        # Check for a stop signal in the log
+        if isinstance(log, dict) and 'stop' in log and log['stop'].startswith('No cameras active'):
+            raise StopLogsSignal("Stop signal received: " + log['stop'])  # Raise a StopLogsSignal exception
+        self.logs.append(log)  # Append the log to the internal list
+
+        # If a webhook URL is provided and real-time posting is enabled, queue the log for the webhook
+        if self.webhook_url and self.post_realtime == True:
+            self._post_webhook(raw)
+
+        return log  # Return the log
+
+
+    def get_realtime_logs(self, refresh=0.5, limit=None, stream=False):
         """
         Summary:
             Retrieves logs in real-time, either indefinitely or up to a specified limit.
@@ -459,17 +640,20 @@ class LogsAPI:
         Description:
             This method provides a generator that yields logs in real-time with a specified refresh rate.
             It can yield logs indefinitely or stop after yielding a set number of logs based on the limit provided.
-            It is designed to be used within a 'with' block for proper resource management.
+            It is designed to be used within a 'with' block for proper resource management. With 'stream' enabled, logs
+            are read from a single long-lived streaming response instead of polling, falling back to polling if the
+            server does not support streaming.
 
         Parameters:
             - 'refresh': The time interval (in seconds) between log fetches. Must be a positive number.
             - 'limit': The maximum number of logs to yield. If None, the generator will run indefinitely.
+            - 'stream': Optional; Boolean indicating whether logs should be streamed over one connection instead of polled.
 
         Returns:
             - A generator that yields logs in real-time.
 
         Exceptions:
-            - Raises InvalidUsageError if 'refresh' is not a positive number or if 'limit' is not a positive integer.
+            - Raises InvalidUsageError if 'refresh' is not a positive finite number or if 'limit' is not a positive integer.
             - Raises ForLoopError if the method is not called within a 'for' loop.
             - Raises RuntimeError if 'limit' is None and the method is not used within a 'with' block.
 
@@ -479,11 +663,17 @@ class LogsAPI:
                     for log in client.get_realtime_logs(refresh=1, limit=10):
                         # process log
         """
-        # Validate the refresh rate and limit before proceeding
-        if not isinstance(refresh, (float, int)) or refresh <= 0:
+        # Validate the refresh rate and limit by converting them, rather than checking their types
+        try:
+            refresh = float(refresh)
+        except (TypeError, ValueError):
+            raise InvalidUsageError("Refresh rate must be a positive number representing seconds.") from None
+        if not (refresh > 0 and math.isfinite(refresh)):  # Also rejects NaN, which compares false to everything
             raise InvalidUsageError("Refresh rate must be a positive number representing seconds.")
-        if limit is not None and not isinstance(limit, int):
-            raise InvalidUsageError("Limit must be an integer representing the maximum number of logs to fetch.")
+        try:
+            limit = None if limit is None else operator.index(limit)
+        except TypeError:
+            raise InvalidUsageError("Limit must be an integer representing the maximum number of logs to fetch.") from None
         if limit is not None and limit <= 0:
             raise InvalidUsageError("Limit must be a positive integer.")
         if not self._called_within_for_loop():
@@ -495,9 +685,127 @@ class LogsAPI:
                 "with client:\n"
                 "   # Your 'for' loop here\n"
             )
+        if stream:
+            return self._stream_log_generator(refresh, limit)
         return self._realtime_log_generator(refresh, limit)
 
 
+    def _stream_log_generator(self, refresh, limit):
+        """
+        Summary:
+            An internal generator method for streaming logs in real-time over a single connection.
+
+        Description:
+            This private method has a background reader open one long-lived request to the recognition API and
+            yields each newline-delimited JSON log as soon as it arrives, avoiding the per-log request overhead of
+            polling. Waiting on the reader instead of the socket lets the 'running' flag be checked every
+            'STREAM_POLL_INTERVAL' seconds without dropping a quiet connection. If the server does not answer with a
+            streaming response, it yields the regular log it returned, if any, and falls back to the polling generator
+            for the rest. It stops on a stop signal, when the server closes the stream, when the limit is reached, or
+            when the 'running' flag is set to False.
+
+        Parameters:
+            - 'refresh': The time interval (in seconds) between log fetches, used only by the polling fallback.
+            - 'limit': The maximum number of logs to yield. If None, the generator will run indefinitely.
+
+        Yields:
+            - Log data as a dictionary for each received log.
+
+        Exceptions:
+            - Raises HTTPRequestError if the stream cannot be opened.
+
+        Usage:
+            - This method should not be called directly; it is intended to be used by the 'get_realtime_logs' method.
+        """
+        self.start_fetching()  # Begin the log fetching process
+        stop = self._stop_event  # Stop token of this run, shared with the reader
+        lines = queue.Queue()  # Filled by the reader, in arrival order
+        threading.Thread(target=self._stream_reader, args=(lines, stop), name='FaceSpaceStream', daemon=True).start()
+        count = 0  # Initialize the count of fetched logs
+        handed_off = False  # Set once the polling fallback owns the cleanup
+        try:
+            # Continue reading logs as long as the limit has not been reached
+            while limit is None or count < limit:
+                try:
+                    item = lines.get(timeout=STREAM_POLL_INTERVAL)
+                except queue.Empty:
+                    if not self.running:
+                        break  # Stopped while the stream was quiet
+                    continue
+                if item is _STREAM_END:
+                    break  # The server closed the stream
+                if isinstance(item, requests.exceptions.RequestException):
+                    logger.error("Request Error: %s", item)
+                    raise HTTPRequestError(f"Request Error: {str(item)}") from item
+                if isinstance(item, requests.Response):
+                    logger.debug('Streaming not supported by the server, falling back to polling.')
+                    with item:  # Release the connection once the body, if any, has been read
+                        # A server ignoring '?stream=1' answers with a regular log, deliver it rather than dropping it
+                        raw = item.content if item.status_code == 200 else None
+                    if raw is not None:
+                        yield self._process_log(raw)  # Yield the received log
+                        if limit is not None:  # Only count down if there is a limit
+                            count += 1
+                        time.sleep(refresh)  # Keep the polling cadence before the next fetch
+                    # Poll for the remaining logs unless fetching was stopped or the limit has been reached
+                    if self.running and (limit is None or count < limit):
+                        handed_off = True
+                        yield from self._realtime_log_generator(refresh, None if limit is None else limit - count)
+                    break
+                log = self._process_log(item)  # Decode and process the log
+                yield log  # Yield the received log
+                if limit is not None:  # Only increment count if there is a limit
+                    count += 1
+                if not self.running:
+                    break  # Stop once the 'running' flag is cleared
+        finally:
+            stop.set()  # Tell the reader to close the stream, also when the polling fallback took over
+            if not handed_off:
+                self.stop_realtime_logs()  # Ensure the fetching process is stopped when the generator exits
+
+
+    def _stream_reader(self, lines, stop):
+        """
+        Summary:
+            Background reader that puts each line of the log stream on a queue.
+
+        Description:
+            This private method runs on a daemon thread for one streaming run. It opens the stream and puts every
+            non-empty line on 'lines' as raw bytes, skipping the server's keep-alive blank lines. Chunked streams are
+            read one chunk at a time and other streams one byte at a time, so no line waits for a read buffer to
+            fill. A stream that stays silent for longer than the read timeout of 'STREAM_TIMEOUT' is reopened. The
+            reader ends by putting '_STREAM_END' when the server closes the stream, the response itself when the
+            server does not stream, or the exception when the stream cannot be opened. It exits without putting
+            anything once 'stop' is set.
+
+        Parameters:
+            - 'lines': The 'queue.Queue' read by '_stream_log_generator'.
+            - 'stop': The 'threading.Event' stop token of the streaming run.
+        """
+        while not stop.is_set():
+            try:
+                response = self.session.get(self._url_recognition, params={'stream': 1}, stream=True, timeout=STREAM_TIMEOUT)
+            except requests.exceptions.RequestException as err:
+                lines.put(err)  # Retries are exhausted, let the generator raise
+                return
+            if response.status_code != 200 or not response.headers.get('Content-Type', '').startswith(STREAM_CONTENT_TYPE):
+                lines.put(response)  # Let the generator fall back to polling
+                return
+            try:
+                with response:
+                    for raw in response.iter_lines(chunk_size=None if response.raw.chunked else 1):
+                        if stop.is_set():
+                            return
+                        if raw:
+                            lines.put(raw)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                # requests reports a read timeout in the body as a ConnectionError
+                logger.debug('Log stream was silent or dropped, reopening it.')
+                continue
+            lines.put(_STREAM_END)
+            return
+
+
     def _realtime_log_generator(self, refresh, limit):
         """
         Summary:
@@ -505,8 +813,12 @@ class LogsAPI:
 
         Description:
             This private method is the core of real-time log fetching, yielding logs at a specified interval.
-            It continues to fetch and yield logs until a stop signal is received, a limit is reached, or the
-            'running' flag is set to False. It ensures that the fetching process is properly terminated upon exit.
+            Fetches are scheduled against a fixed deadline, so time spent waiting on the API or processing a log
+            counts towards the interval instead of being added to it. Each fetch is handed to a background worker
+            that waits for its deadline, so a caller still processing a log when the deadline passes has the next
+            round-trip overlap that processing, without ever receiving a log fetched early. It continues to fetch
+            and yield logs until a stop signal is received, a limit is reached, or the 'running' flag is set to False.
+            It ensures that the fetching process is properly terminated upon exit.
 
         Parameters:
             - 'refresh': The time interval (in seconds) between log fetches.
@@ -519,20 +831,35 @@ class LogsAPI:
             - This method should not be called directly; it is intended to be used by the 'get_realtime_logs' method.
         """
         self.start_fetching()  # Begin the log fetching process
+        stop = self._stop_event  # Stop token of this run, handed to every scheduled fetch
         count = 0  # Initialize the count of fetched logs
+        next_t = time.monotonic()  # Deadline of the current fetch
+        future = self._exec.submit(self._raw_fetch)  # Start fetching the first log
         try:
             # Continue fetching logs as long as the 'running' flag is True and the limit has not been reached
             while self.running and (limit is None or count < limit):
-                log = self.fetch_logs()  # Fetch the logs
+                raw = future.result()  # Wait for the scheduled fetch to complete
+                future = None
+                if raw is None:
+                    break  # Fetching was stopped while the worker waited for its deadline
+                log = self._process_log(raw)  # Process the fetched log
                 # Check for a stop signal in the log
                 if isinstance(log, dict) and 'stop' in log and log['stop'].startswith('No cameras active'):
                     logger.info('Stop signal received, terminating log fetching.')  # Log the stop signal
                     break  # Exit the loop if a stop signal is received
-                yield log  # Yield the fetched log
                 if limit is not None:  # Only increment count if there is a limit
                     count += 1
-                time.sleep(refresh)  # Wait for the specified refresh interval before the next fetch
+                if limit is None or count < limit:
+                    next_t += refresh  # Schedule the next fetch one interval after the previous deadline
+                    now = time.monotonic()
+                    if next_t < now:
+                        next_t = now  # Running behind, reset the schedule instead of bursting to catch up
+                    # The worker waits for the deadline itself, so it overlaps only processing that runs past it
+                    future = self._exec.submit(self._fetch_at, next_t, stop)
+                yield log  # Yield the fetched log
         finally:
+            if future is not None:
+                future.cancel()  # Discard a prefetch that is no longer needed
             self.stop_realtime_logs()  # Ensure the fetching process is stopped when the generator exits
 
 
@@ -542,8 +869,8 @@ class LogsAPI:
             Checks if the current method invocation occurs within the context of a 'for' loop.
 
         Description:
-            This private method inspects the call stack to determine if the current function call
-            is made from within a 'for' loop. It is a utility function used to enforce correct usage
+            This private method walks the call stack frame by frame to determine if the current function call
+            is made from within a 'for' loop, stopping at the first match. It is a utility function used to enforce correct usage
             patterns for certain generator methods.
 
         Returns:
@@ -552,23 +879,24 @@ class LogsAPI:
         Usage:
             - This method is used internally to validate that certain methods are being called in the correct context.
         """
-        frames = inspect.stack()  # Get the current call stack
-        for frame in frames[2:]:  # Iterate over the call stack, skipping the first two frames
-            if frame.code_context:  # Check if there is code context available for the frame
-                for line in frame.code_context:  # Iterate over the lines of code in the context
-                    # Check if the line contains a 'for' loop syntax
-                    if 'for ' in line and ' in ' in line:
-                        return True  # Return True if a 'for' loop is found
+        frame = sys._getframe(2)  # Start from the caller of the public method, skipping the first two frames
+        while frame is not None:  # Walk up the call stack one frame at a time
+            # Check if the line being executed in this frame contains a 'for' loop syntax
+            if _is_for_loop_line(frame.f_code.co_filename, frame.f_lineno):
+                return True  # Return True if a 'for' loop is found
+            frame = frame.f_back
         return False  # Return False if no 'for' loop is found in the call stack
 
-        return False
-            
     def start_fetching(self):
         """Set to true when realtime logs start, makes it easy to stop when running"""
+        self._stop_event = threading.Event()  # Fresh stop token, so waits left over from an earlier run stay stopped
         self.running = True
 
     def stop_realtime_logs(self):
         """Very important to close connections in case of terminal failure and is automatically managed"""
         self.running = False
+        self._stop_event.set()  # Wake any scheduled fetch waiting for its deadline
+        self._stop_webhook_worker()
         self.session.close()
+        self.webhook_session.close()
         logger.info('Log fetching has been stopped.')
\ No newline at end of file
@@ -0,0 +1,43 @@
+###############################################################################################
+#                                                                                             #
+#                               AUTOMA CORPORATION (c) 2023                                   #
+#                                                                                             #
+#      ALL RIGHTS RESERVED. UNAUTHORIZED COPYING, REPRODUCTION, HIRE, LENDING, PUBLIC         #
+#      PERFORMANCE, AND BROADCASTING OF THIS SOFTWARE, VIA ANY MEDIUM, ARE PROHIBITED.        #
+#                                                                                             #
+#                  PROPRIETARY AND CONFIDENTIAL INFORMATION OF AUTOMA CORPORATION             #
+#                                                                                             #
+###############################################################################################
+
+
+import requests, threading
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
+
+
+_shared_session = None  # Created on first use by 'shared_session'
+_shared_session_lock = threading.Lock()
+
+
+def shared_session():
+    """
+    Summary:
+        Returns the process-wide pooled session for calls to the FaceSpace services.
+
+    Description:
+        The session is created on first use with a mounted HTTPAdapter, so consecutive calls to 'vision.automa.one'
+        reuse keep-alive TCP/TLS connections instead of paying a new handshake each time. Every caller gets the same
+        session, which is also exposed as 'facespace.session'. 'LogsAPI' keeps its own pooled session per client, since it carries that client's API key.
+
+    Returns:
+        - The shared 'requests.Session' instance.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:  # Another thread may have created it while we waited for the lock
+                session = requests.Session()
+                retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+                session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+                _shared_session = session
+    return _shared_session